@@ -18,7 +18,10 @@ if config.config_file_name is not None:
 
 # Add the project's root directory to the Python path.
 # This ensures that alembic can find your models.
-sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+# env.py is re-executed for every alembic command, so only insert the path once.
+project_root = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Now we can import our models
 from shared_models.models import Base
@@ -9,7 +9,9 @@ from sqlalchemy import text
 
 # Add the parent directory to sys.path to import shared_models
 import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+package_dir = os.path.dirname(os.path.abspath(__file__))
+if package_dir not in sys.path:
+    sys.path.insert(0, package_dir)
 
 from shared_models.database import engine
 
@@ -8,6 +8,12 @@ import logging # Import logging for status validation warnings
 # Setup logger for status validation warnings
 logger = logging.getLogger(__name__)
 
+# --- Native meeting ID / passcode patterns (compiled once at import) ---
+GOOGLE_MEET_ID_PATTERN = re.compile(r"^[a-z]{3}-[a-z]{4}-[a-z]{3}$")
+# re.ASCII: \d must mean [0-9] here, not any Unicode digit (e.g. Arabic-Indic)
+TEAMS_MEETING_ID_PATTERN = re.compile(r"^\d{10,15}$", re.ASCII)
+TEAMS_PASSCODE_PATTERN = re.compile(r'^[A-Za-z0-9]{8,20}$')
+
 # --- Language Codes from faster-whisper ---
 # These are the accepted language codes from the faster-whisper library
 # Source: faster_whisper.tokenizer._LANGUAGE_CODES
@@ -234,14 +240,14 @@ class Platform(str, Enum):
             platform = Platform(platform_str)
             if platform == Platform.GOOGLE_MEET:
                 # Basic validation for Google Meet code format (xxx-xxxx-xxx)
-                if re.fullmatch(r"^[a-z]{3}-[a-z]{4}-[a-z]{3}$", native_id):
+                if GOOGLE_MEET_ID_PATTERN.fullmatch(native_id):
                      return f"https://meet.google.com/{native_id}"
                 else:
                      return None # Invalid ID format
             elif platform == Platform.TEAMS:
                 # Teams meeting ID (numeric) and optional passcode
                 # Only accept numeric meeting IDs, not full URLs
-                if re.fullmatch(r"^\d{10,15}$", native_id):
+                if TEAMS_MEETING_ID_PATTERN.fullmatch(native_id):
                     url = f"https://teams.live.com/meet/{native_id}"
                     if passcode:
                         url += f"?p={passcode}"
@@ -355,7 +361,7 @@ class MeetingCreate(BaseModel):
                 raise ValueError("Passcode is not supported for Google Meet meetings")
             elif platform == Platform.TEAMS:
                 # Teams passcode validation (alphanumeric, reasonable length)
-                if not re.match(r'^[A-Za-z0-9]{8,20}$', v):
+                if not TEAMS_PASSCODE_PATTERN.match(v):
                     raise ValueError("Teams passcode must be 8-20 alphanumeric characters")
         return v
 
@@ -391,12 +397,12 @@ class MeetingCreate(BaseModel):
         
         if platform == Platform.GOOGLE_MEET:
             # Google Meet format: abc-defg-hij
-            if not re.fullmatch(r"^[a-z]{3}-[a-z]{4}-[a-z]{3}$", native_id):
+            if not GOOGLE_MEET_ID_PATTERN.fullmatch(native_id):
                 raise ValueError("Google Meet ID must be in format 'abc-defg-hij' (lowercase letters only)")
         
         elif platform == Platform.TEAMS:
             # Teams format: numeric ID only (10-15 digits)
-            if not re.fullmatch(r"^\d{10,15}$", native_id):
+            if not TEAMS_MEETING_ID_PATTERN.fullmatch(native_id):
                 raise ValueError("Teams meeting ID must be 10-15 digits only (not a full URL)")
             
             # Explicitly reject full URLs
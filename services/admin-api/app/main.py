@@ -2,6 +2,8 @@ import logging
 import secrets
 import string
 import os
+from collections import Counter
+from operator import itemgetter
 from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, Security, Response
 from fastapi.security import APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -611,9 +613,11 @@ async def get_user_details(
     meetings = meetings_result.scalars().all()
     
     total_meetings = len(meetings)
-    completed_meetings = len([m for m in meetings if m.status == 'completed'])
-    failed_meetings = len([m for m in meetings if m.status == 'failed'])
-    active_meetings = len([m for m in meetings if m.status in ['requested', 'joining', 'awaiting_admission', 'active']])
+    # Single pass over statuses instead of one filtered list per count
+    status_counts = Counter(m.status for m in meetings)
+    completed_meetings = status_counts['completed']
+    failed_meetings = status_counts['failed']
+    active_meetings = sum(status_counts[s] for s in ('requested', 'joining', 'awaiting_admission', 'active'))
     
     # Calculate duration stats
     completed_with_duration = [m for m in meetings if m.status == 'completed' and m.start_time and m.end_time]
@@ -635,7 +639,7 @@ async def get_user_details(
         platform_counts = {}
         for meeting in meetings:
             platform_counts[meeting.platform] = platform_counts.get(meeting.platform, 0) + 1
-        most_used_platform = max(platform_counts, key=platform_counts.get) if platform_counts else None
+        most_used_platform = max(platform_counts.items(), key=itemgetter(1))[0] if platform_counts else None
         
         # Meetings per day (based on creation date)
         days_since_first = (datetime.utcnow() - min(m.created_at for m in meetings)).days + 1
@@ -3,11 +3,17 @@ import os
 REDIS_URL = os.environ.get("REDIS_URL")
 if not REDIS_URL:
     raise ValueError("Missing required environment variable: REDIS_URL")
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", "50"))
+# Seconds to wait for a free pooled connection before raising (pool blocks instead of failing)
+REDIS_POOL_TIMEOUT = float(os.environ.get("REDIS_POOL_TIMEOUT", "20"))
 
 # Bot configuration
 BOT_IMAGE_NAME = os.environ.get("BOT_IMAGE_NAME", "vexa-bot:latest")
 DOCKER_NETWORK = os.environ.get("DOCKER_NETWORK", "vexa_default")
 
+# Secret used to sign MeetingTokens (read once at startup)
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+
 # Lock settings
 DEFAULT_LANGUAGE = os.environ.get("DEFAULT_LANGUAGE")  # e.g. "pl" for Polish
 DEFAULT_TASK = os.environ.get("DEFAULT_TASK")  # e.g. "transcribe" (keep original language) or "translate" (to English)
@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 import logging
 import os
+import time
 import base64
 from typing import Optional, List, Dict, Any
 import redis.asyncio as aioredis
@@ -18,9 +19,9 @@ import uuid as uuid_lib
 # from app.database.service import TranscriptionService # Not used here
 # from app.tasks.monitoring import celery_app # Not used here
 
-from .config import BOT_IMAGE_NAME, REDIS_URL, DEFAULT_LANGUAGE, DEFAULT_TASK
+from .config import BOT_IMAGE_NAME, REDIS_URL, REDIS_MAX_CONNECTIONS, REDIS_POOL_TIMEOUT, DEFAULT_LANGUAGE, DEFAULT_TASK, ADMIN_TOKEN
 from app.orchestrators import (
-    get_socket_session, close_docker_client, start_bot_container,
+    get_socket_session, close_docker_client, aclose_client, start_bot_container,
     stop_bot_container, _record_session_start, get_running_bots_status,
     verify_container_running,
 )
@@ -76,13 +77,7 @@ async def update_meeting_status(
         await db.commit()
     
     # Validate transition
-    # #region agent log
-    try:
-        with open('/home/dima/dev/.cursor/debug.log', 'a') as f:
-            import json
-            f.write(json.dumps({"location": "bot-manager/main.py:79", "message": "Validating status transition", "data": {"meeting_id": meeting.id, "current_status": current_status.value, "new_status": new_status.value}, "timestamp": __import__('time').time(), "sessionId": "debug-session", "runId": "run1", "hypothesisId": "D"}) + "\n")
-    except: pass
-    # #endregion
+    logger.debug("Validating status transition for meeting %s: %s -> %s", meeting.id, current_status.value, new_status.value)
     
     if not is_valid_status_transition(current_status, new_status):
         logger.warning(f"Invalid status transition from '{current_status.value}' to '{new_status.value}' for meeting {meeting.id}")
@@ -171,20 +166,24 @@ async def update_meeting_status(
 
 from app.tasks.bot_exit_tasks import run_all_tasks
 from app.tasks.webhook_runner import run_status_webhook_task
+from app.tasks.webhook_client import close_webhook_client
 
 def _b64url_encode(data: bytes) -> str:
     """URL-safe base64 encoding without padding."""
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
+# Signing key encoded once instead of on every mint
+_MEETING_TOKEN_KEY = ADMIN_TOKEN.encode("utf-8") if ADMIN_TOKEN else None
+# The JWT header never changes, so its encoded form is built once
+_JWT_HEADER_B64 = _b64url_encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(',', ':')).encode('utf-8'))
+
 def mint_meeting_token(meeting_id: int, user_id: int, platform: str, native_meeting_id: str, ttl_seconds: int = 3600) -> str:
     """Mint a MeetingToken (HS256 JWT) using ADMIN_TOKEN."""
-    secret = os.environ.get("ADMIN_TOKEN")
-    if not secret:
+    if not _MEETING_TOKEN_KEY:
         raise ValueError("ADMIN_TOKEN not configured; cannot mint MeetingToken")
     
-    now = int(datetime.utcnow().timestamp())
+    now = time.time_ns() // 1_000_000_000
     
-    header = {"alg": "HS256", "typ": "JWT"}
     payload = {
         "meeting_id": meeting_id,
         "user_id": user_id,
@@ -198,10 +197,11 @@ def mint_meeting_token(meeting_id: int, user_id: int, platform: str, native_meet
         "jti": str(uuid_lib.uuid4())
     }
     
-    header_b64 = _b64url_encode(json.dumps(header, separators=(',', ':')).encode('utf-8'))
+    header_b64 = _JWT_HEADER_B64
     payload_b64 = _b64url_encode(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
     signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
-    signature = hmac.new(secret.encode("utf-8"), signing_input, digestmod='sha256').digest()
+    # One-shot C implementation; avoids building an HMAC object per token
+    signature = hmac.digest(_MEETING_TOKEN_KEY, signing_input, 'sha256')
     signature_b64 = _b64url_encode(signature)
     
     return f"{header_b64}.{payload_b64}.{signature_b64}"
@@ -314,7 +314,14 @@ async def startup_event():
     # --- ADD Redis Client Initialization ---
     try:
         logger.info(f"Connecting to Redis at {REDIS_URL}...")
-        redis_client = await aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True)
+        # Explicit bounded pool shared by all handlers (publish, status updates, ...).
+        # Blocking pool: a burst beyond max_connections waits for a free connection
+        # instead of failing with "Too many connections".
+        redis_pool = aioredis.BlockingConnectionPool.from_url(
+            REDIS_URL, encoding="utf-8", decode_responses=True,
+            max_connections=REDIS_MAX_CONNECTIONS, timeout=REDIS_POOL_TIMEOUT,
+        )
+        redis_client = aioredis.Redis(connection_pool=redis_pool)
         await redis_client.ping() # Verify connection
         logger.info("Successfully connected to Redis.")
     except Exception as e:
@@ -340,12 +347,16 @@ async def shutdown_event():
         logger.info("Closing Redis connection...")
         try:
             await redis_client.close()
+            await redis_client.connection_pool.disconnect()  # pool is not owned by the client
             logger.info("Redis connection closed.")
         except Exception as e:
             logger.error(f"Error closing Redis connection: {e}", exc_info=True)
     # ---------------------------------
 
+    await close_webhook_client()
+
     close_docker_client()
+    await aclose_client()  # async HTTP client held by some orchestrators (nomad); no-op otherwise
     logger.info("Docker Client closed.")
 
 # --- ADDED: Delayed Stop Task ---
@@ -1335,13 +1346,7 @@ async def bot_status_change_callback(
     new_status = payload.status
     reason = payload.reason
 
-    # #region agent log
-    try:
-        with open('/home/dima/dev/.cursor/debug.log', 'a') as f:
-            import json
-            f.write(json.dumps({"location": "bot-manager/main.py:1320", "message": "Unified callback received", "data": {"connection_id": session_uid, "new_status": new_status.value, "reason": reason}, "timestamp": __import__('time').time(), "sessionId": "debug-session", "runId": "run1", "hypothesisId": "A"}) + "\n")
-    except: pass
-    # #endregion
+    logger.debug("Unified callback received for connection %s: status=%s, reason=%s", session_uid, new_status.value, reason)
 
     try:
         # Find the meeting session to get the meeting_id
@@ -1448,33 +1453,15 @@ async def bot_status_change_callback(
                 
         else:
             # Handle other status changes (joining, awaiting_admission)
-            # #region agent log
-            try:
-                with open('/home/dima/dev/.cursor/debug.log', 'a') as f:
-                    import json
-                    f.write(json.dumps({"location": "bot-manager/main.py:1423", "message": "Before update_meeting_status", "data": {"meeting_id": meeting_id, "old_status": meeting.status, "new_status": new_status.value}, "timestamp": __import__('time').time(), "sessionId": "debug-session", "runId": "run1", "hypothesisId": "B"}) + "\n")
-            except: pass
-            # #endregion
+            logger.debug("Updating meeting %s status: %s -> %s", meeting_id, meeting.status, new_status.value)
             
             success = await update_meeting_status(meeting, new_status, db)
             
-            # #region agent log
-            try:
-                with open('/home/dima/dev/.cursor/debug.log', 'a') as f:
-                    import json
-                    f.write(json.dumps({"location": "bot-manager/main.py:1429", "message": "After update_meeting_status", "data": {"meeting_id": meeting_id, "success": success, "meeting_status": meeting.status}, "timestamp": __import__('time').time(), "sessionId": "debug-session", "runId": "run1", "hypothesisId": "B"}) + "\n")
-            except: pass
-            # #endregion
+            logger.debug("Meeting %s status update success=%s, status now %s", meeting_id, success, meeting.status)
             
             if not success:
                 logger.error(f"Bot status change callback: Failed to update meeting {meeting_id} status to '{new_status.value}'")
-                # #region agent log
-                try:
-                    with open('/home/dima/dev/.cursor/debug.log', 'a') as f:
-                        import json
-                        f.write(json.dumps({"location": "bot-manager/main.py:1435", "message": "Status update failed", "data": {"meeting_id": meeting_id, "old_status": old_status, "new_status": new_status.value}, "timestamp": __import__('time').time(), "sessionId": "debug-session", "runId": "run1", "hypothesisId": "C"}) + "\n")
-                except: pass
-                # #endregion
+                logger.debug("Meeting %s status update failed: %s -> %s", meeting_id, old_status, new_status.value)
                 return {"status": "error", "detail": "Failed to update meeting status"}
 
         # Publish meeting status change via Redis Pub/Sub
@@ -1613,7 +1600,7 @@ async def reconcile_meetings_and_containers():
                                     'old_status': old_status_value,
                                     'new_status': MeetingStatus.COMPLETED.value,
                                     'reason': 'reconciliation_zombie_meeting',
-                                    'timestamp': __import__('datetime').datetime.utcnow().isoformat(),
+                                    'timestamp': datetime.utcnow().isoformat(),
                                     'transition_source': 'reconciliation'
                                 }
                             )
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import os
 import uuid
+import asyncio
 import logging
 import json
 from typing import Optional, Tuple, Dict, Any, List
@@ -37,12 +38,41 @@ def get_socket_session(*_args, **_kwargs):  # type: ignore
     """Return None – kept for API compatibility (Docker-specific concept)."""
     return None
 
+# Shared HTTP client so consecutive Nomad API calls reuse keep-alive
+# connections instead of opening a fresh TCP connection per request.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared Nomad HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+    return _http_client
+
+
+# Caps concurrent per-job detail lookups (shared across status requests) well below the
+# client's max_connections, so fan-out never exhausts the pool and hits PoolTimeout.
+_JOB_DETAIL_CONCURRENCY = 8
+_job_detail_semaphore = asyncio.Semaphore(_JOB_DETAIL_CONCURRENCY)
+
 def close_client():  # type: ignore
-    """No persistent Nomad client yet – nothing to close."""
+    """No synchronous Nomad client to close – see aclose_client()."""
     return None
 
 close_docker_client = close_client  # compatibility alias
 
+
+async def aclose_client() -> None:
+    """Close the shared Nomad HTTP client, if one was created."""
+    global _http_client
+    client, _http_client = _http_client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 # ---------------------------------------------------------------------------
 # Core public API -------------------------------------------------------------
 
@@ -105,22 +135,22 @@ async def start_bot_container(
     )
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=payload, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            dispatched_id = data.get("DispatchedJobID") or data.get("EvaluationID")
-            if not dispatched_id:
-                logger.warning(
-                    "Nomad dispatch response missing DispatchedJobID; full response: %s", data
-                )
-                dispatched_id = f"unknown-{uuid.uuid4()}"
-            logger.info(
-                "Successfully dispatched Nomad job. Dispatch ID=%s, connection_id=%s",
-                dispatched_id,
-                connection_id,
+        client = _get_http_client()
+        resp = await client.post(url, json=payload, timeout=10)
+        resp.raise_for_status()
+        data = resp.json()
+        dispatched_id = data.get("DispatchedJobID") or data.get("EvaluationID")
+        if not dispatched_id:
+            logger.warning(
+                "Nomad dispatch response missing DispatchedJobID; full response: %s", data
             )
-            return dispatched_id, connection_id
+            dispatched_id = f"unknown-{uuid.uuid4()}"
+        logger.info(
+            "Successfully dispatched Nomad job. Dispatch ID=%s, connection_id=%s",
+            dispatched_id,
+            connection_id,
+        )
+        return dispatched_id, connection_id
     except httpx.HTTPStatusError as e:
         error_details = "Unknown error"
         try:
@@ -181,6 +211,67 @@ def stop_bot_container(container_id: str) -> bool:
     return False
 
 
+async def _get_user_bot_status(
+    client: httpx.AsyncClient, job: Dict[str, Any], user_id: int
+) -> Optional[Dict[str, Any]]:
+    """Return the bot status dict for a Nomad job if it belongs to user_id, else None."""
+    job_id = job.get("ID")
+    job_status = job.get("Status", "")
+    job_detail_url = f"{NOMAD_ADDR}/v1/job/{job_id}"
+    
+    async with _job_detail_semaphore:
+        try:
+            detail_resp = await client.get(job_detail_url, timeout=10)
+            detail_resp.raise_for_status()
+            job_detail = detail_resp.json()
+        
+            # Extract metadata from the job
+            job_meta = job_detail.get("Meta", {})
+            job_user_id = job_meta.get("user_id")
+        
+            # Only include bots for the requested user
+            if not job_user_id or str(job_user_id) != str(user_id):
+                return None
+
+            # Get allocation info for container details
+            allocations_url = f"{NOMAD_ADDR}/v1/job/{job_id}/allocations"
+            alloc_resp = await client.get(allocations_url, timeout=10)
+            alloc_resp.raise_for_status()
+            allocations = alloc_resp.json()
+        
+            container_id = None
+            if allocations:
+                # Use the first allocation ID as container ID
+                container_id = allocations[0].get("ID")
+        
+            # Map normalized status for clients
+            normalized = None
+            if job_status == "running":
+                normalized = "Up"
+            elif job_status == "pending":
+                normalized = "Starting"
+            elif job_status in ["dead", "complete"]:
+                normalized = "Exited"
+
+            bot_status = {
+                "container_id": container_id,
+                "container_name": job_id,
+                "platform": job_meta.get("platform"),
+                "native_meeting_id": job_meta.get("native_meeting_id"),
+                "status": job_status,
+                "normalized_status": normalized,
+                "created_at": job.get("SubmitTime"),
+                "labels": job_meta,
+                "meeting_id_from_name": job_meta.get("meeting_id")
+            }
+            logger.debug(f"Found running bot: {bot_status}")
+            return bot_status
+        
+        except Exception as detail_error:
+            logger.warning(f"Failed to get details for job {job_id}: {detail_error}")
+            return None
+
+
 async def get_running_bots_status(user_id: int) -> List[Dict[str, Any]]:
     """Return a list of running bots for the given user by querying Nomad API.
     
@@ -194,79 +285,32 @@ async def get_running_bots_status(user_id: int) -> List[Dict[str, Any]]:
         url = f"{NOMAD_ADDR}/v1/jobs"
         params = {"prefix": BOT_JOB_NAME}
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, params=params, timeout=10)
-            resp.raise_for_status()
-            jobs_data = resp.json()
-            
-            running_bots = []
-            
-            for job in jobs_data:
-                # Only process vexa-bot jobs
-                if not job.get("ID", "").startswith(BOT_JOB_NAME):
-                    continue
-                    
-                # Check if job is active or pending
-                job_status = job.get("Status", "")
-                if job_status not in ["running", "pending", "dead", "complete"]:
-                    continue
-                
-                # Get job details to access metadata
-                job_id = job.get("ID")
-                job_detail_url = f"{NOMAD_ADDR}/v1/job/{job_id}"
+        client = _get_http_client()
+        resp = await client.get(url, params=params, timeout=10)
+        resp.raise_for_status()
+        jobs_data = resp.json()
+        
+        candidate_jobs = []
+        for job in jobs_data:
+            # Only process vexa-bot jobs
+            if not job.get("ID", "").startswith(BOT_JOB_NAME):
+                continue
                 
-                try:
-                    detail_resp = await client.get(job_detail_url, timeout=10)
-                    detail_resp.raise_for_status()
-                    job_detail = detail_resp.json()
-                    
-                    # Extract metadata from the job
-                    job_meta = job_detail.get("Meta", {})
-                    job_user_id = job_meta.get("user_id")
-                    
-                    # Only include bots for the requested user
-                    if job_user_id and str(job_user_id) == str(user_id):
-                        # Get allocation info for container details
-                        allocations_url = f"{NOMAD_ADDR}/v1/job/{job_id}/allocations"
-                        alloc_resp = await client.get(allocations_url, timeout=10)
-                        alloc_resp.raise_for_status()
-                        allocations = alloc_resp.json()
-                        
-                        container_id = None
-                        if allocations:
-                            # Use the first allocation ID as container ID
-                            container_id = allocations[0].get("ID")
-                        
-                        # Map normalized status for clients
-                        normalized = None
-                        if job_status == "running":
-                            normalized = "Up"
-                        elif job_status == "pending":
-                            normalized = "Starting"
-                        elif job_status in ["dead", "complete"]:
-                            normalized = "Exited"
-
-                        bot_status = {
-                            "container_id": container_id,
-                            "container_name": job_id,
-                            "platform": job_meta.get("platform"),
-                            "native_meeting_id": job_meta.get("native_meeting_id"),
-                            "status": job_status,
-                            "normalized_status": normalized,
-                            "created_at": job.get("SubmitTime"),
-                            "labels": job_meta,
-                            "meeting_id_from_name": job_meta.get("meeting_id")
-                        }
-                        
-                        running_bots.append(bot_status)
-                        logger.debug(f"Found running bot: {bot_status}")
-                        
-                except Exception as detail_error:
-                    logger.warning(f"Failed to get details for job {job_id}: {detail_error}")
-                    continue
-            
-            logger.info(f"Found {len(running_bots)} running bots for user {user_id}")
-            return running_bots
+            # Check if job is active or pending
+            job_status = job.get("Status", "")
+            if job_status not in ["running", "pending", "dead", "complete"]:
+                continue
+            candidate_jobs.append(job)
+        
+        # Fetch job details concurrently (bounded by _job_detail_semaphore) instead of
+        # one round trip per job
+        results = await asyncio.gather(
+            *(_get_user_bot_status(client, job, user_id) for job in candidate_jobs)
+        )
+        running_bots = [bot_status for bot_status in results if bot_status is not None]
+        
+        logger.info(f"Found {len(running_bots)} running bots for user {user_id}")
+        return running_bots
             
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP {e.response.status_code} error querying Nomad jobs: {e}")
@@ -290,17 +334,17 @@ async def verify_container_running(container_id: str) -> bool:
         # Query Nomad for the specific allocation
         url = f"{NOMAD_ADDR}/v1/allocation/{container_id}"
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, timeout=10)
-            resp.raise_for_status()
-            allocation_data = resp.json()
-            
-            # Check if allocation is running
-            client_status = allocation_data.get("ClientStatus", "")
-            is_running = client_status in ["running", "pending"]
-            
-            logger.debug(f"Allocation {container_id} client status: {client_status}, running: {is_running}")
-            return is_running
+        client = _get_http_client()
+        resp = await client.get(url, timeout=10)
+        resp.raise_for_status()
+        allocation_data = resp.json()
+        
+        # Check if allocation is running
+        client_status = allocation_data.get("ClientStatus", "")
+        is_running = client_status in ["running", "pending"]
+        
+        logger.debug(f"Allocation {container_id} client status: {client_status}, running: {is_running}")
+        return is_running
             
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
@@ -3,6 +3,7 @@ import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 from shared_models.models import Meeting, User
 from shared_models.webhook_url import validate_webhook_url
+from .webhook_client import get_webhook_client
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -85,21 +86,21 @@ async def run(meeting: Meeting, db: AsyncSession, status_change_info: Optional[D
 
         headers = _build_webhook_headers(user.data)
 
-        # Send the webhook (follow_redirects=True for backward compatibility with
-        # receivers that use redirects; URL validated at storage and send time)
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            logger.info(f"Sending status webhook to {webhook_url} for meeting {meeting.id} (status: {meeting.status})")
-            response = await client.post(
-                webhook_url,
-                json=payload,
-                timeout=30.0,
-                headers=headers
-            )
-            
-            if response.status_code >= 200 and response.status_code < 300:
-                logger.info(f"Successfully sent status webhook for meeting {meeting.id} to {webhook_url}")
-            else:
-                logger.warning(f"Status webhook for meeting {meeting.id} returned status {response.status_code}: {response.text}")
+        # Send the webhook over the shared client (follows redirects; URL validated
+        # at storage and send time)
+        client = get_webhook_client()
+        logger.info(f"Sending status webhook to {webhook_url} for meeting {meeting.id} (status: {meeting.status})")
+        response = await client.post(
+            webhook_url,
+            json=payload,
+            timeout=30.0,
+            headers=headers
+        )
+        
+        if response.status_code >= 200 and response.status_code < 300:
+            logger.info(f"Successfully sent status webhook for meeting {meeting.id} to {webhook_url}")
+        else:
+            logger.warning(f"Status webhook for meeting {meeting.id} returned status {response.status_code}: {response.text}")
 
     except httpx.RequestError as e:
         logger.error(f"Failed to send status webhook for meeting {meeting.id}: {e}")
@@ -0,0 +1,36 @@
+import logging
+import http.cookiejar
+import httpx
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Shared client for outgoing user webhooks. A meeting emits several status
+# webhooks to the same URL, so keep-alive connections are reused instead of
+# paying a new TCP/TLS handshake per webhook.
+_webhook_client: Optional[httpx.AsyncClient] = None
+
+
+def get_webhook_client() -> httpx.AsyncClient:
+    """Returns the shared webhook HTTP client, creating it on first use."""
+    global _webhook_client
+    if _webhook_client is None or _webhook_client.is_closed:
+        # follow_redirects=True for backward compatibility with receivers that use redirects;
+        # URLs are validated at storage and send time.
+        # The client is shared across all users' webhooks, so refuse every cookie: otherwise a
+        # Set-Cookie from one tenant's endpoint would be replayed to another's on a shared host.
+        _webhook_client = httpx.AsyncClient(
+            cookies=http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])),
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
+        )
+    return _webhook_client
+
+
+async def close_webhook_client():
+    """Closes the shared webhook HTTP client if it was created."""
+    global _webhook_client
+    if _webhook_client is not None:
+        logger.info("Closing webhook HTTP client.")
+        await _webhook_client.aclose()
+        _webhook_client = None
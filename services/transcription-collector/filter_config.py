@@ -2,6 +2,8 @@
 # This file can be edited to add or modify filtering behavior 
 # without changing the core code
 
+import re
+
 # Additional patterns to filter out beyond the default ones
 ADDITIONAL_FILTER_PATTERNS = [
     # Add your own patterns here
@@ -19,11 +21,13 @@ MIN_REAL_WORDS = 1
 # Define your own custom filter functions here
 # Each function should take text as input and return True to keep or False to filter out
 
+# Any character repeated 5+ times in a row (compiled once; filters run per segment)
+REPEATED_CHARACTER_PATTERN = re.compile(r'(.)\1{4,}')
+
 def filter_out_repeated_characters(text):
     """Filter out strings with excessive character repetition, like 'aaaaaa' or 'hahahaha'"""
     # If any character appears more than 4 times in a row, filter it out
-    import re
-    if re.search(r'(.)\1{4,}', text):
+    if REPEATED_CHARACTER_PATTERN.search(text):
         return False
     return True
 
@@ -35,6 +35,8 @@ class TranscriptionFilter:
         
         # Load configuration
         self.load_config()
+        # Compile once; filter_segment runs for every transcript segment
+        self.compiled_patterns = [re.compile(pattern) for pattern in self.patterns]
     
     def load_config(self):
         """Load filter configuration from filter_config.py"""
@@ -118,9 +120,9 @@ class TranscriptionFilter:
             return False
         
         # Check against patterns
-        for pattern in self.patterns:
-            if re.match(pattern, text):
-                logger.debug(f"Filtering out text matching pattern {pattern}: '{original_text_for_logging}'")
+        for pattern in self.compiled_patterns:
+            if pattern.match(text):
+                logger.debug(f"Filtering out text matching pattern {pattern.pattern}: '{original_text_for_logging}'")
                 return False
         
         # Count actual words (at least 3 characters) - exclude stopwords
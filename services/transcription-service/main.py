@@ -3,23 +3,29 @@ Vexa-Compatible Transcription Service (PoC)
 Implements OpenAI Whisper API format for seamless integration with Vexa
 """
 import os
-import io
+import math
 import time
 import logging
 import asyncio
 import json
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
 import numpy as np
 import soundfile as sf
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import APIKeyHeader
 import uvicorn
 from faster_whisper import WhisperModel
 # faster-whisper uses CTranslate2 internally (no PyTorch needed)
 
+try:
+    from scipy.signal import resample_poly
+except ImportError:  # SciPy is optional; fall back to linear interpolation
+    resample_poly = None
+
 # Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,15 +44,19 @@ DEVICE = os.getenv("DEVICE", "cuda")
 # Compute type optimization: Use INT8 for optimal VRAM efficiency
 # Research shows: large-v3-turbo + INT8 = ~2.1 GB VRAM (validated)
 # Provides 50-60% VRAM reduction with minimal accuracy loss (~1-2% WER increase)
+# COMPUTE_TYPE=auto lets CTranslate2 pick the fastest type supported by the device
 COMPUTE_TYPE_ENV = os.getenv("COMPUTE_TYPE", "").strip().lower()
 if COMPUTE_TYPE_ENV:
     COMPUTE_TYPE = COMPUTE_TYPE_ENV
 else:
-    # Default to INT8 for both GPU and CPU (optimal balance of speed, memory, and accuracy)
-    COMPUTE_TYPE = "int8"
+    # GPU: INT8 weights with FP16 activations (plain int8 keeps FP32 activations and is slower on CUDA)
+    # CPU: INT8
+    COMPUTE_TYPE = "int8_float16" if DEVICE == "cuda" else "int8"
 
 # CPU threads configuration (for CPU mode optimization)
-CPU_THREADS = int(os.getenv("CPU_THREADS", "0"))  # 0 = auto-detect
+CPU_THREADS = int(os.getenv("CPU_THREADS", "0"))  # per concurrent transcription; 0 = auto (see startup)
+# Upper bound for the automatic value (matches faster-whisper's own default of 4)
+AUTO_CPU_THREADS_MAX = 4
 
 # Quality / decoding parameters (optional)
 def _env_bool(name: str, default: bool) -> bool:
@@ -76,8 +86,13 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 # WhisperLive-inspired defaults (can be overridden via env)
-BEAM_SIZE = _env_int("BEAM_SIZE", 5)
-BEST_OF = _env_int("BEST_OF", 5)
+# Greedy decoding by default: streaming windows are short, and beam search costs several times
+# the decoder work for little WER gain. Clients can request beam search per call.
+BEAM_SIZE = _env_int("BEAM_SIZE", 1)
+BEST_OF = _env_int("BEST_OF", 1)
+# Upper bounds for client-supplied beam_size/best_of (larger values are rejected with 422)
+MAX_BEAM_SIZE = _env_int("MAX_BEAM_SIZE", 5)
+MAX_BEST_OF = _env_int("MAX_BEST_OF", 5)
 COMPRESSION_RATIO_THRESHOLD = _env_float("COMPRESSION_RATIO_THRESHOLD", 2.4)
 LOG_PROB_THRESHOLD = _env_float("LOG_PROB_THRESHOLD", -1.0)
 NO_SPEECH_THRESHOLD = _env_float("NO_SPEECH_THRESHOLD", 0.6)
@@ -93,24 +108,153 @@ VAD_MIN_SILENCE_DURATION_MS = _env_int("VAD_MIN_SILENCE_DURATION_MS", 160)
 USE_TEMPERATURE_FALLBACK = _env_bool("USE_TEMPERATURE_FALLBACK", False)
 TEMPERATURE_FALLBACK_CHAIN = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
 
-def _looks_like_silence(segments: List[Dict[str, Any]]) -> bool:
+# Energy gate: skip the model entirely for near-silent chunks (both RMS and peak must be below)
+SILENCE_RMS_THRESHOLD = _env_float("SILENCE_RMS_THRESHOLD", 0.003)
+SILENCE_PEAK_THRESHOLD = _env_float("SILENCE_PEAK_THRESHOLD", 0.02)
+
+# Batched inference (faster-whisper >= 1.1): splits one request's audio into VAD chunks
+# and decodes them as a single batch. 0 = disabled (sequential transcribe).
+BATCH_SIZE = _env_int("BATCH_SIZE", 0)
+
+# faster-whisper expects raw float32 arrays at 16 kHz
+SAMPLE_RATE_WHISPER = 16000
+
+# Run one dummy inference at startup so the first real request doesn't pay CUDA/kernel warm-up
+WARMUP_ON_STARTUP = _env_bool("WARMUP_ON_STARTUP", True)
+
+def _resample_to_16k(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Resample mono float32 audio to 16 kHz (no-op if already 16 kHz)."""
+    if sample_rate == SAMPLE_RATE_WHISPER or audio.size == 0:
+        return audio
+    if resample_poly is not None:
+        # Polyphase FIR (anti-aliased), stays in float32
+        g = math.gcd(sample_rate, SAMPLE_RATE_WHISPER)
+        resampled = resample_poly(audio, SAMPLE_RATE_WHISPER // g, sample_rate // g, window=("kaiser", 8.0))
+        return resampled.astype(np.float32, copy=False)
+    # Linear interpolation in float32 (np.interp would upcast the whole buffer to float64).
+    # Source positions are computed with exact integer math: out[i] sits at i * sr / 16000.
+    n_in = len(audio)
+    n_out = int(round(n_in * SAMPLE_RATE_WHISPER / sample_rate))
+    pos = np.arange(n_out, dtype=np.int64) * sample_rate
+    idx0 = np.minimum(pos // SAMPLE_RATE_WHISPER, n_in - 1)
+    idx1 = np.minimum(idx0 + 1, n_in - 1)
+    frac = (pos % SAMPLE_RATE_WHISPER).astype(np.float32)
+    frac *= np.float32(1.0 / SAMPLE_RATE_WHISPER)
+    out = audio[idx1] - audio[idx0]
+    out *= frac
+    out += audio[idx0]
+    return out
+
+def _decode_audio(source) -> Tuple[np.ndarray, int]:
+    """Decode a file-like object into a (frames, channels) float32 array."""
+    with sf.SoundFile(source, "r") as sfh:
+        sample_rate = sfh.samplerate
+        audio = sfh.read(dtype="float32", always_2d=True)
+    return audio, sample_rate
+
+def _load_audio_16k(source) -> np.ndarray:
+    """Decode, downmix to mono and resample to 16 kHz (blocking; run in a worker thread)."""
+    audio, sample_rate = _decode_audio(source)
+    logger.debug("Worker %s decoded audio - shape: %s, sample_rate: %s", WORKER_ID, audio.shape, sample_rate)
+
+    # Ensure mono audio (downmix into a preallocated buffer; mono input is a zero-copy view)
+    num_frames, num_channels = audio.shape
+    if num_channels > 1:
+        mono = np.empty(num_frames, dtype=np.float32)
+        np.mean(audio, axis=1, out=mono)
+        audio = mono
+        logger.debug("Worker %s converted to mono - shape: %s", WORKER_ID, audio.shape)
+    else:
+        audio = audio[:, 0]
+
+    # The mono buffer is float32 already, so no extra ascontiguousarray copy is needed.
+    # Resample once; every transcription attempt reuses this buffer.
+    # model.transcribe() assumes 16 kHz for raw arrays; resample other rates
+    if sample_rate != SAMPLE_RATE_WHISPER:
+        audio = _resample_to_16k(audio, sample_rate)
+        logger.debug(
+            "Worker %s resampled %s Hz -> %s Hz - shape: %s",
+            WORKER_ID, sample_rate, SAMPLE_RATE_WHISPER, audio.shape,
+        )
+    return audio
+
+def _is_silent_audio(audio: np.ndarray) -> bool:
+    """Cheap energy gate on raw samples: True if RMS and peak are both below threshold."""
+    if audio.size == 0:
+        return True
+    rms = float(np.sqrt(np.dot(audio, audio) / audio.size))
+    if rms >= SILENCE_RMS_THRESHOLD:
+        return False
+    peak = float(np.max(np.abs(audio)))
+    return peak < SILENCE_PEAK_THRESHOLD
+
+@dataclass(slots=True)
+class TranscriptionSegment:
+    """One decoded segment; serialized to the verbose_json shape only at response time."""
+    id: int
+    start: float
+    end: float
+    text: str
+    temperature: float
+    avg_logprob: float
+    compression_ratio: float
+    no_speech_prob: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "seek": 0,
+            "start": self.start,
+            "end": self.end,
+            "text": self.text,
+            "tokens": [],  # Not needed for PoC
+            "temperature": self.temperature,
+            "avg_logprob": self.avg_logprob,
+            "compression_ratio": self.compression_ratio,
+            "no_speech_prob": self.no_speech_prob,
+            # Add audio_ fields that RemoteTranscriber looks for
+            "audio_start": self.start,
+            "audio_end": self.end,
+        }
+
+def _build_segments(segments_iter, temperature: float) -> List[TranscriptionSegment]:
+    """Materialize faster-whisper's segment generator into TranscriptionSegments."""
+    return [
+        TranscriptionSegment(
+            id=idx,
+            start=segment.start,
+            end=segment.end,
+            text=segment.text.strip(),
+            temperature=temperature,
+            avg_logprob=segment.avg_logprob,
+            compression_ratio=segment.compression_ratio,
+            no_speech_prob=segment.no_speech_prob,
+        )
+        for idx, segment in enumerate(segments_iter)
+    ]
+
+def _join_segments(segments: List[TranscriptionSegment]) -> str:
+    """Join already-stripped segment texts into the full transcript."""
+    return " ".join(s.text for s in segments if s.text)
+
+def _looks_like_silence(segments: List[TranscriptionSegment]) -> bool:
     """Heuristic: treat as silence if all segments look like no-speech."""
     if not segments:
         return True
     for s in segments:
         if not (
-            float(s.get("no_speech_prob", 0.0)) > NO_SPEECH_THRESHOLD
-            and float(s.get("avg_logprob", 0.0)) < LOG_PROB_THRESHOLD
+            s.no_speech_prob > NO_SPEECH_THRESHOLD
+            and s.avg_logprob < LOG_PROB_THRESHOLD
         ):
             return False
     return True
 
-def _looks_like_hallucination(segments: List[Dict[str, Any]]) -> bool:
+def _looks_like_hallucination(segments: List[TranscriptionSegment]) -> bool:
     """Heuristic: reject segments that look like hallucinations / low-confidence."""
     for s in segments:
-        if float(s.get("compression_ratio", 0.0)) > COMPRESSION_RATIO_THRESHOLD:
+        if s.compression_ratio > COMPRESSION_RATIO_THRESHOLD:
             return True
-        if float(s.get("avg_logprob", 0.0)) < LOG_PROB_THRESHOLD:
+        if s.avg_logprob < LOG_PROB_THRESHOLD:
             return True
     return False
 
@@ -153,6 +297,8 @@ app = FastAPI(
 
 # Global model instance
 model: Optional[WhisperModel] = None
+# Optional batched wrapper around `model` (only when BATCH_SIZE > 0)
+batched_model = None
 
 # Load management: Global concurrency limit and bounded queue
 # These settings control how many transcription requests can be processed concurrently
@@ -166,21 +312,24 @@ FAIL_FAST_WHEN_BUSY = _env_bool("FAIL_FAST_WHEN_BUSY", True)
 BUSY_RETRY_AFTER_S = _env_int("BUSY_RETRY_AFTER_S", 1)
 
 # Semaphore to limit concurrent transcriptions (protects GPU/CPU from overload)
-transcription_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIPTIONS)
+transcription_semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_TRANSCRIPTIONS)
 
-# Thread pool for running blocking transcription calls
+# Thread pool for running blocking transcription calls (installed as the loop's default
+# executor at startup, so asyncio.to_thread() uses it)
 transcription_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TRANSCRIPTIONS)
 
 # Queue to track waiting requests (for 429/503 responses when full)
-# We use a simple counter since FastAPI doesn't have a built-in queue
+# We use a simple counter since FastAPI doesn't have a built-in queue. It is only touched
+# on the event loop between awaits, so it needs no lock.
 waiting_requests = 0
-waiting_requests_lock = asyncio.Lock()
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize Whisper model on startup"""
-    global model
+    global model, batched_model
+    # Route asyncio.to_thread() onto the bounded transcription pool
+    asyncio.get_running_loop().set_default_executor(transcription_executor)
     logger.info(f"Worker {WORKER_ID} starting up...")
     logger.info(f"Device: {DEVICE}, Model: {MODEL_SIZE}, Compute: {COMPUTE_TYPE}")
     logger.info(
@@ -203,16 +352,53 @@ async def startup_event():
         }
         
         # Add CPU threads for CPU mode (optimization from research)
-        if DEVICE == "cpu" and CPU_THREADS > 0:
-            model_kwargs["cpu_threads"] = CPU_THREADS
-            logger.info(f"Worker {WORKER_ID} using {CPU_THREADS} CPU threads")
+        if DEVICE == "cpu":
+            # CPU_THREADS=0: split the cores across concurrent requests, capped at faster-whisper's
+            # default of 4 so large hosts don't end up with very wide per-request thread pools
+            if CPU_THREADS > 0:
+                cpu_threads = CPU_THREADS
+            else:
+                cores_per_request = (os.cpu_count() or 1) // MAX_CONCURRENT_TRANSCRIPTIONS
+                cpu_threads = max(1, min(AUTO_CPU_THREADS_MAX, cores_per_request))
+            model_kwargs["cpu_threads"] = cpu_threads
+            # One CTranslate2 worker per concurrent request so they run in parallel, not serialized
+            model_kwargs["num_workers"] = MAX_CONCURRENT_TRANSCRIPTIONS
+            logger.info(
+                f"Worker {WORKER_ID} using {cpu_threads} CPU threads x {MAX_CONCURRENT_TRANSCRIPTIONS} model workers"
+            )
         
         model = WhisperModel(**model_kwargs)
-        logger.info(f"Worker {WORKER_ID} ready - Model loaded successfully")
+        # Log what CTranslate2 actually resolved (e.g. for "auto" or unsupported types)
+        resolved_compute_type = getattr(model.model, "compute_type", COMPUTE_TYPE)
+        logger.info(f"Worker {WORKER_ID} ready - Model loaded successfully (compute_type={resolved_compute_type})")
+
+        if BATCH_SIZE > 0:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                batched_model = BatchedInferencePipeline(model=model)
+                logger.info(f"Worker {WORKER_ID} using batched inference (batch_size={BATCH_SIZE})")
+            except ImportError:
+                logger.warning(
+                    f"Worker {WORKER_ID} BATCH_SIZE={BATCH_SIZE} requires faster-whisper>=1.1; "
+                    "falling back to sequential transcription"
+                )
     except Exception as e:
         logger.error(f"Failed to load model: {e}")
         raise
 
+    if WARMUP_ON_STARTUP:
+        def _warmup_sync():
+            warmup_audio = np.zeros(SAMPLE_RATE_WHISPER * 2, dtype=np.float32)
+            segments, _ = model.transcribe(warmup_audio, beam_size=1, vad_filter=False)
+            list(segments)  # segments is a lazy generator; consume it to actually run decoding
+
+        try:
+            warmup_start = time.time()
+            await asyncio.to_thread(_warmup_sync)
+            logger.info(f"Worker {WORKER_ID} warmup inference done in {time.time() - warmup_start:.2f}s")
+        except Exception as e:
+            logger.warning(f"Worker {WORKER_ID} warmup inference failed (continuing): {e}")
+
 
 @app.get("/health")
 async def health_check():
@@ -247,6 +433,8 @@ async def transcribe_audio(
     response_format: str = Form("verbose_json"),
     timestamp_granularities: str = Form("segment"),
     task: str = Form("transcribe"),
+    beam_size: Optional[int] = Form(None),
+    best_of: Optional[int] = Form(None),
     _: bool = Depends(verify_api_token)
 ):
     """
@@ -260,170 +448,186 @@ async def transcribe_audio(
     Load management:
     - Limits concurrent transcriptions to prevent GPU/CPU overload
     - Returns 429/503 when queue is full to signal backpressure
+    
+    Decoding:
+    - beam_size/best_of default to BEAM_SIZE/BEST_OF (greedy unless configured); larger
+      values can improve accuracy at several times the decoder cost, so they are capped
+      at MAX_BEAM_SIZE/MAX_BEST_OF
     """
     if not requested_model:
         raise HTTPException(status_code=400, detail="Model parameter is required")
+    if beam_size is not None and not 1 <= beam_size <= MAX_BEAM_SIZE:
+        raise HTTPException(status_code=422, detail=f"beam_size must be between 1 and {MAX_BEAM_SIZE}")
+    if best_of is not None and not 1 <= best_of <= MAX_BEST_OF:
+        raise HTTPException(status_code=422, detail=f"best_of must be between 1 and {MAX_BEST_OF}")
     
-    # Load management: Check queue size before accepting request
-    async with waiting_requests_lock:
-        global waiting_requests
+    # Load management: Check capacity before accepting request
+    global waiting_requests
+    if FAIL_FAST_WHEN_BUSY:
         # Fail-fast mode: don't accept work we can't start immediately.
         # This avoids "processing the first chunk" (small/old) and lets upstream buffer/coalesce.
-        if FAIL_FAST_WHEN_BUSY and (transcription_semaphore.locked() or waiting_requests > 0):
+        # No await between this check and acquire(), so the acquire below never blocks.
+        if transcription_semaphore.locked():
             raise HTTPException(
                 status_code=503,
                 detail="Service busy. Please retry later.",
                 headers={"Retry-After": str(max(1, BUSY_RETRY_AFTER_S))},
             )
-        if waiting_requests >= MAX_QUEUE_SIZE:
-            logger.warning(
-                f"Worker {WORKER_ID} queue full ({waiting_requests}/{MAX_QUEUE_SIZE}). "
-                f"Rejecting request with 503."
-            )
-            raise HTTPException(
-                status_code=503,
-                detail="Service temporarily overloaded. Please retry later.",
-                headers={"Retry-After": str(max(1, BUSY_RETRY_AFTER_S))}
-            )
-        waiting_requests += 1
+    elif waiting_requests >= MAX_QUEUE_SIZE:
+        logger.warning(
+            f"Worker {WORKER_ID} queue full ({waiting_requests}/{MAX_QUEUE_SIZE}). "
+            f"Rejecting request with 503."
+        )
+        raise HTTPException(
+            status_code=503,
+            detail="Service temporarily overloaded. Please retry later.",
+            headers={"Retry-After": str(max(1, BUSY_RETRY_AFTER_S))}
+        )
     
+    # Acquire semaphore (blocks if MAX_CONCURRENT_TRANSCRIPTIONS is reached)
+    waiting_requests += 1
     try:
-        # Acquire semaphore (blocks if MAX_CONCURRENT_TRANSCRIPTIONS is reached)
         await transcription_semaphore.acquire()
-        
-        async with waiting_requests_lock:
-            waiting_requests -= 1
-        
+    finally:
+        waiting_requests -= 1
+    
+    try:
         start_time = time.time()
-        logger.info(f"Worker {WORKER_ID} received transcription request - filename: {file.filename}, content_type: {file.content_type}")
-        # Read audio file
-        audio_bytes = await file.read()
-        logger.info(f"Worker {WORKER_ID} read {len(audio_bytes)} bytes of audio data")
-        
+        logger.info(
+            "Worker %s received transcription request - filename: %s, content_type: %s",
+            WORKER_ID, file.filename, file.content_type,
+        )
         # Convert to format suitable for faster-whisper
         # Use soundfile to properly decode audio formats (WAV, MP3, etc.)
-        audio_io = io.BytesIO(audio_bytes)
+        # Decode straight from the spooled upload (always a seekable temp file) instead of
+        # copying it into memory first. Decode/downmix/resample are CPU-bound, so they run
+        # off the event loop.
         try:
-            audio_array, sample_rate = sf.read(audio_io, dtype=np.float32)
-            logger.info(f"Worker {WORKER_ID} decoded audio - shape: {audio_array.shape}, sample_rate: {sample_rate}")
+            audio_array = await asyncio.to_thread(_load_audio_16k, file.file)
         except Exception as e:
             logger.error(f"Worker {WORKER_ID} failed to decode audio with soundfile: {e}")
             raise HTTPException(status_code=400, detail=f"Failed to decode audio file: {e}")
         
-        # Ensure mono audio (convert stereo to mono if needed)
-        if len(audio_array.shape) > 1:
-            audio_array = np.mean(audio_array, axis=1)
-            logger.info(f"Worker {WORKER_ID} converted to mono - shape: {audio_array.shape}")
-        
-        # Ensure audio is contiguous array
-        audio_array = np.ascontiguousarray(audio_array, dtype=np.float32)
+        # Near-silent chunk: return an empty transcription without running the model.
+        # Only when the caller fixed the language: otherwise the response must carry a real
+        # detected code, since clients (WhisperLive) lock their session to the first one seen.
+        if language and _is_silent_audio(audio_array):
+            logger.debug("Worker %s skipped model for silent audio (energy gate)", WORKER_ID)
+            return {
+                "text": "",
+                "language": language,
+                "duration": 0.0,
+                "segments": [],
+            }
         
         # Transcribe (with optional temperature fallback)
         requested_temp = float(temperature) if temperature else 0.0
         temps = TEMPERATURE_FALLBACK_CHAIN if USE_TEMPERATURE_FALLBACK else [requested_temp]
+        effective_beam_size = beam_size if beam_size is not None else BEAM_SIZE
+        effective_best_of = best_of if best_of is not None else BEST_OF
 
         logger.info(
-            f"Worker {WORKER_ID} starting transcription - requested_temp: {requested_temp}, "
-            f"temps: {temps}, language: {language}, task: {task}, vad_filter: {VAD_FILTER}"
+            "Worker %s starting transcription - requested_temp: %s, temps: %s, language: %s, task: %s, "
+            "vad_filter: %s, beam_size: %s, best_of: %s",
+            WORKER_ID, requested_temp, temps, language, task, VAD_FILTER, effective_beam_size, effective_best_of,
         )
 
-        best: Optional[Tuple[str, str, float, List[Dict[str, Any]]]] = None
-        last_info = None
-        last_segments: List[Dict[str, Any]] = []
-
-        for t in temps:
-            # Run blocking transcription in thread pool to avoid blocking event loop
-            def _transcribe_sync():
-                return model.transcribe(
-                    audio_array,
-                    language=language,
-                    task=task,
-                    initial_prompt=prompt,
-                    temperature=t,
-                    beam_size=BEAM_SIZE,
-                    best_of=BEST_OF,
-                    compression_ratio_threshold=COMPRESSION_RATIO_THRESHOLD,
-                    log_prob_threshold=LOG_PROB_THRESHOLD,
-                    no_speech_threshold=NO_SPEECH_THRESHOLD,
-                    condition_on_previous_text=CONDITION_ON_PREVIOUS_TEXT,
-                    prompt_reset_on_temperature=PROMPT_RESET_ON_TEMPERATURE,
-                    vad_filter=VAD_FILTER,
-                    vad_parameters={
-                        "threshold": VAD_FILTER_THRESHOLD,
-                        "min_silence_duration_ms": VAD_MIN_SILENCE_DURATION_MS,
-                    },
-                    word_timestamps=False,
-                )
-            
-            segments_list, info = await asyncio.get_event_loop().run_in_executor(
-                transcription_executor, _transcribe_sync
+        # Run blocking transcription in thread pool to avoid blocking event loop
+        def _transcribe_sync(t: float) -> Tuple[List[TranscriptionSegment], Any]:
+            if batched_model is not None:
+                transcribe_fn = batched_model.transcribe
+                batch_kwargs = {"batch_size": BATCH_SIZE}
+            else:
+                transcribe_fn = model.transcribe
+                batch_kwargs = {}
+            segments_iter, info = transcribe_fn(
+                audio_array,
+                language=language,
+                task=task,
+                initial_prompt=prompt,
+                temperature=t,
+                beam_size=effective_beam_size,
+                best_of=effective_best_of,
+                compression_ratio_threshold=COMPRESSION_RATIO_THRESHOLD,
+                log_prob_threshold=LOG_PROB_THRESHOLD,
+                no_speech_threshold=NO_SPEECH_THRESHOLD,
+                condition_on_previous_text=CONDITION_ON_PREVIOUS_TEXT,
+                prompt_reset_on_temperature=PROMPT_RESET_ON_TEMPERATURE,
+                vad_filter=VAD_FILTER,
+                vad_parameters={
+                    "threshold": VAD_FILTER_THRESHOLD,
+                    "min_silence_duration_ms": VAD_MIN_SILENCE_DURATION_MS,
+                },
+                word_timestamps=False,
+                **batch_kwargs,
             )
-            last_info = info
-
-            # Convert segments to list (faster-whisper returns generator)
-            segments: List[Dict[str, Any]] = []
-            for idx, segment in enumerate(segments_list):
-                segments.append({
-                    "id": idx,
-                    "seek": 0,
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text,
-                    "tokens": [],  # Not needed for PoC
-                    "temperature": t,
-                    "avg_logprob": segment.avg_logprob,
-                    "compression_ratio": segment.compression_ratio,
-                    "no_speech_prob": segment.no_speech_prob,
-                    # Add audio_ fields that RemoteTranscriber looks for
-                    "audio_start": segment.start,
-                    "audio_end": segment.end,
-                })
-            last_segments = segments
+            # faster-whisper decodes lazily while the generator is consumed, so consume it here
+            return _build_segments(segments_iter, t), info
 
+        if not USE_TEMPERATURE_FALLBACK:
+            # Fast path: a single attempt at the requested temperature
+            segments, info = await asyncio.to_thread(_transcribe_sync, requested_temp)
+            detected_language = info.language
             if _looks_like_silence(segments):
-                best = ("", info.language, 0.0, [])
-                logger.info(f"Worker {WORKER_ID} detected silence (temp={t})")
-                break
-
-            is_hallucination = _looks_like_hallucination(segments)
-
-            if not is_hallucination:
-                full_text = " ".join([s["text"].strip() for s in segments]).strip()
-                duration = segments[-1]["end"] if segments else 0.0
-                best = (full_text, info.language, duration, segments)
-                logger.info(f"Worker {WORKER_ID} accepted transcription (temp={t})")
-                break
+                logger.info("Worker %s detected silence (temp=%s)", WORKER_ID, requested_temp)
+                full_text, duration, segments = "", 0.0, []
             else:
-                logger.info(f"Worker {WORKER_ID} rejected transcription as hallucination/low-confidence (temp={t})")
-
-        if best is None:
-            # Fall back to last attempt (even if it looks low-quality) to preserve backward behavior.
-            info = last_info
-            segments = last_segments
-            full_text = " ".join([s["text"].strip() for s in segments]).strip()
-            duration = segments[-1]["end"] if segments else 0.0
-            best = (full_text, info.language if info else (language or "unknown"), duration, segments)
-
-        full_text, detected_language, duration, segments = best
-        logger.info(f"Worker {WORKER_ID} transcription completed - language: {detected_language}")
-        
+                full_text = _join_segments(segments)
+                duration = segments[-1].end
+        else:
+            best: Optional[Tuple[str, str, float, List[TranscriptionSegment]]] = None
+            last_info = None
+            last_segments: List[TranscriptionSegment] = []
+
+            for t in temps:
+                segments, info = await asyncio.to_thread(_transcribe_sync, t)
+                last_info = info
+                last_segments = segments
+
+                if _looks_like_silence(segments):
+                    best = ("", info.language, 0.0, [])
+                    logger.info("Worker %s detected silence (temp=%s)", WORKER_ID, t)
+                    break
+
+                is_hallucination = _looks_like_hallucination(segments)
+
+                if not is_hallucination:
+                    full_text = _join_segments(segments)
+                    duration = segments[-1].end if segments else 0.0
+                    best = (full_text, info.language, duration, segments)
+                    logger.debug("Worker %s accepted transcription (temp=%s)", WORKER_ID, t)
+                    break
+                else:
+                    logger.info("Worker %s rejected transcription as hallucination/low-confidence (temp=%s)", WORKER_ID, t)
+
+            if best is None:
+                # Fall back to last attempt (even if it looks low-quality) to preserve backward behavior.
+                info = last_info
+                segments = last_segments
+                full_text = _join_segments(segments)
+                duration = segments[-1].end if segments else 0.0
+                best = (full_text, info.language if info else (language or "unknown"), duration, segments)
+
+            full_text, detected_language, duration, segments = best
+
         processing_time = time.time() - start_time
         logger.info(
-            f"Worker {WORKER_ID} completed in {processing_time:.2f}s - "
-            f"Duration: {duration:.2f}s, Segments: {len(segments)}, Language: {detected_language}"
+            "Worker %s completed in %.2fs - Duration: %.2fs, Segments: %d, Language: %s",
+            WORKER_ID, processing_time, duration, len(segments), detected_language,
         )
         
         # Return format expected by Vexa RemoteTranscriber
+        # (serialized directly with orjson, skipping FastAPI's jsonable_encoder pass)
         response = {
             "text": full_text,
             "language": detected_language,
             "duration": duration,
-            "segments": segments,
+            "segments": [s.to_dict() for s in segments],
         }
         
         # CTranslate2 handles memory management automatically
         
-        return response
+        return ORJSONResponse(content=response)
         
     except HTTPException:
         # Re-raise HTTP exceptions (429, 503, etc.)